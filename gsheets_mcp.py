@@ -1,76 +1,752 @@
 import os
+import re
 import time
+import random
+import asyncio
 import functools
+import threading
+import contextlib
+import weakref
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional, Union, Callable, Any, Tuple
 
 import gspread
+import orjson
 from fastmcp import FastMCP, Context
-from oauth2client.service_account import ServiceAccountCredentials
+from google.auth.transport.requests import Request
+from google.oauth2.service_account import Credentials
+from googleapiclient.discovery import build
+from requests.adapters import HTTPAdapter
 
 # Initialize FastMCP server
 mcp = FastMCP("Google Sheets MCP")
 
+# Authorized gspread clients keyed by (credentials path, credentials mtime),
+# so the key file is only parsed and exchanged for a token once per process
+_CLIENT_CACHE: Dict[Tuple[str, int], gspread.Client] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# Connection pool shared by every client session, so warm connections to
+# Google APIs survive a client being rebuilt after the credentials change.
+# Retries are left to backoff_handler rather than urllib3
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+
+# Transport for access token requests. It must not be the client's own
+# AuthorizedSession, which would refresh the token again before sending the
+# token request
+_AUTH_REQUEST = Request()
+_AUTH_REQUEST.session.mount('https://', _HTTP_ADAPTER)
+
+# Recently opened spreadsheets keyed by (client, spreadsheet ID), and their
+# worksheets by title keyed by (HTTP client, spreadsheet ID), mapped to
+# (cached at, value), so hot sheets skip the metadata fetches
+_SPREADSHEET_CACHE: "OrderedDict[Tuple[gspread.Client, str], Tuple[float, gspread.Spreadsheet]]" = OrderedDict()
+_WORKSHEET_CACHE: "OrderedDict[Tuple[gspread.HTTPClient, str], Tuple[float, Dict[str, gspread.Worksheet]]]" = OrderedDict()
+_METADATA_CACHE_LOCK = threading.Lock()
+_METADATA_CACHE_TTL = 60.0
+_METADATA_CACHE_SIZE = 128
+
+# Also matches Workspace (/a/<domain>/spreadsheets/d/...) and account (/spreadsheets/u/0/d/...) links
+_SHEET_ID_RE = re.compile(r'/spreadsheets/(?:u/\d+/)?d/([a-zA-Z0-9-_]+)')
+
+# Opt-in cache of get_google_sheet results keyed by (spreadsheet ID, worksheet name, formatted),
+# mapped to (fetched at, result). Concurrent misses for the same key wait on a
+# per-key lock so only one of them fetches the data
+_READ_CACHE: "OrderedDict[Tuple[str, Optional[str], bool], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_READ_CACHE_LOCK = threading.Lock()
+_READ_CACHE_SIZE = 32
+_READ_CACHE_KEY_LOCKS: "weakref.WeakValueDictionary[Tuple[str, Optional[str], bool], asyncio.Lock]" = weakref.WeakValueDictionary()
+
+# Keep each values write request comfortably below the Sheets API payload limit
+_MAX_WRITE_PAYLOAD_BYTES = 1_500_000
+
+# Largest page of files the Drive API returns from one files.list call
+_DRIVE_PAGE_SIZE = 1000
+
+# Maximum number of calls the Drive API accepts in one batch request
+_DRIVE_BATCH_SIZE = 100
+
+# API error statuses worth retrying: rate limiting, and transient server failures.
+# A 5xx may arrive after the server already applied the request, so those are
+# only retried for idempotent calls
+_RATE_LIMIT_STATUS_CODE = 429
+_SERVER_ERROR_STATUS_CODES = frozenset((500, 502, 503, 504))
+
+# Layouts update_google_sheet accepts data in: a list of rows or a list of columns
+_MAJOR_DIMENSIONS = frozenset(('ROWS', 'COLUMNS'))
+
+# Cell value types accepted by update_google_sheet
+_CELL_TYPES = frozenset((str, int, float, bool))
+
+# Input validation patterns, checked before any API work is done
+# Host check only, the spreadsheet ID itself is found with _SHEET_ID_RE
+_SHEET_URL_RE = re.compile(r'^https://docs\.google\.com/')
+_SHEET_KEY_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+class TokenBucket:
+    """Client-side rate limiter that spaces out requests to stay within API quota.
+    
+    Tokens are replenished at `rate` per second up to `capacity`, and each request
+    takes one token, waiting for it if the bucket is empty. When the API still
+    answers with 429 the rate is halved, and it recovers gradually with each
+    successful request.
+    """
+    
+    def __init__(self, rate: float, capacity: float, min_rate: float = 0.1):
+        """Initialize the bucket.
+        
+        Args:
+            rate: Maximum number of requests per second
+            capacity: Maximum number of requests that can be sent in a burst
+            min_rate: Lower bound for the rate after repeated rate limit errors
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take a token from the bucket.
+        
+        Returns:
+            Number of seconds to wait before the request may be sent
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def on_rate_limited(self) -> None:
+        """Halve the rate after the API rejected a request with 429"""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+    
+    def on_success(self) -> None:
+        """Slowly recover the rate after a successful request"""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+# Upper bound on Google API requests in flight at once, so a burst of tool calls
+# cannot pile up against the quota. A slot is only held while a request is being
+# sent, never while waiting on a rate limiter or sleeping between retries, so
+# throttled writes do not hold up reads or token refreshes
+_API_CONCURRENCY = threading.BoundedSemaphore(5)
+
+# Separate buckets for read and write requests, sized to the default
+# Sheets API per-user quota of 60 requests per minute each
+_READ_LIMITER = TokenBucket(rate=60 / 60.0, capacity=60)
+_WRITE_LIMITER = TokenBucket(rate=60 / 60.0, capacity=60)
+
+class OrjsonHTTPClient(gspread.HTTPClient):
+    """gspread HTTP client that serializes JSON request bodies with orjson.
+    
+    orjson is several times faster than the standard json module and produces
+    bytes directly, which matters for large value updates.
+    """
+    
+    def request(self, method, endpoint, params=None, data=None, json=None, files=None, headers=None):
+        if json is not None:
+            try:
+                data = orjson.dumps(json)
+            except orjson.JSONEncodeError:
+                # Leave values orjson can't encode (e.g. huge integers) to requests
+                pass
+            else:
+                headers = {**(headers or {}), 'Content-Type': 'application/json'}
+                json = None
+        return super().request(method, endpoint, params=params, data=data, json=json,
+                               files=files, headers=headers)
+
+async def run_blocking(func: Callable, *args: Any) -> Any:
+    """Run a blocking gspread call in a worker thread without stalling the event loop"""
+    return await asyncio.to_thread(func, *args)
+
+def server_retry_delay(error: gspread.exceptions.APIError) -> Optional[float]:
+    """Extract the retry delay suggested by the API for a rejected request.
+    
+    Args:
+        error: The API error raised for the request
+    
+    Returns:
+        Delay in seconds taken from the Retry-After header or the RetryInfo
+        error detail, or None if the server did not provide one
+    """
+    retry_after = error.response.headers.get('Retry-After', '').strip()
+    if retry_after.isdigit():
+        return float(retry_after)
+    if retry_after:
+        # Retry-After may also be an HTTP date
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            pass
+    
+    # Google APIs may report the delay as a RetryInfo detail, e.g. {"retryDelay": "5s"}
+    for detail in error.error.get('details', []):
+        retry_delay = detail.get('retryDelay') if isinstance(detail, dict) else None
+        if isinstance(retry_delay, str) and retry_delay.endswith('s'):
+            try:
+                return float(retry_delay[:-1])
+            except ValueError:
+                pass
+    
+    return None
+
+def error_status(error: gspread.exceptions.APIError) -> Optional[int]:
+    """HTTP status code of an API error, or None if it has no response"""
+    return getattr(getattr(error, 'response', None), 'status_code', None)
+
+def is_retryable_error(error: gspread.exceptions.APIError, idempotent: bool = True) -> bool:
+    """Check whether an API error is a rate limit (429) or, for idempotent calls, a transient server (5xx) error.
+    
+    Anything else, such as a bad request, missing credentials, a permission
+    error or a missing spreadsheet, fails on the first attempt.
+    """
+    status = error_status(error)
+    return status == _RATE_LIMIT_STATUS_CODE or (idempotent and status in _SERVER_ERROR_STATUS_CODES)
+
 # Backoff decorator for handling API rate limiting
-def backoff_handler(max_retries: int = 5, initial_delay: float = 1.0):
+def backoff_handler(max_retries: int = 5, initial_delay: float = 1.0,
+                    max_delay: float = 30.0,
+                    rate_limiter: Optional[TokenBucket] = None,
+                    idempotent: bool = True):
     """Decorator that implements exponential backoff for API calls.
     
+    Uses "full jitter": each retry sleeps a random time between zero and the
+    current delay, so concurrent callers do not retry in lockstep. The decorated
+    functions are blocking and are run in worker threads via run_blocking, so
+    waiting here does not stall the event loop.
+    
     Args:
-        max_retries: Maximum number of retry attempts
+        max_retries: Maximum number of attempts, at least 1
         initial_delay: Initial delay in seconds, will be doubled each retry
+        max_delay: Upper bound in seconds for the delay; if the server asks
+            to wait longer than this, the error is raised without retrying
+        rate_limiter: Optional token bucket every attempt has to pass through
+            before it is sent; it is slowed down when the API answers 429
+        idempotent: Whether the call can safely be repeated after a 5xx error,
+            which may come back after the server already applied it
     
     Returns:
         Decorated function with retry logic
     """
+    if max_retries < 1:
+        raise ValueError("max_retries must be at least 1")
+    
+    def retry_sleep_time(error: gspread.exceptions.APIError, delay: float) -> Optional[float]:
+        # Fully jittered exponential backoff, but never less than the server asks for.
+        # None when the server asks for a longer wait than max_delay: give up instead
+        server_delay = server_retry_delay(error)
+        if server_delay is not None and server_delay > max_delay:
+            return None
+        sleep_for = random.uniform(0, min(delay, max_delay))
+        if server_delay is not None:
+            sleep_for = max(server_delay, sleep_for)
+        return sleep_for
+    
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             delay = initial_delay
-            last_exception = None
             
             for retry in range(max_retries):
                 try:
-                    return func(*args, **kwargs)
+                    if rate_limiter:
+                        rate_limiter.acquire()
+                    with _API_CONCURRENCY:
+                        result = func(*args, **kwargs)
+                    if rate_limiter:
+                        rate_limiter.on_success()
+                    return result
                 except gspread.exceptions.APIError as e:
-                    # Check if it's a rate limit error (429)
-                    if hasattr(e, 'response') and getattr(e.response, 'status_code', None) == 429:
-                        last_exception = e
-                        # Wait with exponential backoff
-                        time.sleep(delay)
-                        delay *= 2  # Double the delay for next retry
-                    else:
-                        # If it's not a rate limit error, re-raise immediately
+                    # If it's not a rate limit or transient server error, re-raise immediately
+                    if not is_retryable_error(e, idempotent):
                         raise
-            
-            # If we've exhausted all retries, raise the last exception
-            if last_exception:
-                raise last_exception
+                    if rate_limiter and error_status(e) == _RATE_LIMIT_STATUS_CODE:
+                        rate_limiter.on_rate_limited()
+                    # No point sleeping after the last attempt or past max_delay
+                    sleep_for = retry_sleep_time(e, delay)
+                    if retry == max_retries - 1 or sleep_for is None:
+                        raise
+                    time.sleep(sleep_for)
+                    delay = min(delay * 2, max_delay)  # Double the delay for next retry
         
         return wrapper
     
     return decorator
 
-@backoff_handler(max_retries=5, initial_delay=1.0)
 def init_gspread_client():
-    """Initialize and return a gspread client using service account credentials"""
+    """Return a gspread client using service account credentials.
+    
+    The authorized client is cached per credentials file and reused across tool
+    calls, so its HTTP session keeps connections to Google alive. The cache entry
+    is invalidated when the credentials file is modified. The access token is
+    only refreshed once it has expired; google-auth retries transient token
+    endpoint failures itself.
+    """
     scope = ['https://spreadsheets.google.com/feeds',
              'https://www.googleapis.com/auth/drive']
     
     script_dir = os.path.dirname(os.path.abspath(__file__))
     creds_file = os.getenv('GOOGLE_CREDS_FILE', os.path.join(script_dir, 'google_creds.json'))
-    credentials = ServiceAccountCredentials.from_json_keyfile_name(creds_file, scope)
-    return gspread.authorize(credentials)
+    cache_key = (creds_file, os.stat(creds_file).st_mtime_ns)
+    
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(cache_key)
+        if client is None:
+            credentials = Credentials.from_service_account_file(creds_file, scopes=scope)
+            client = gspread.authorize(credentials, http_client=OrjsonHTTPClient)
+            
+            # Reuse TCP+TLS connections between requests
+            session = client.http_client.session
+            session.headers.update({'Connection': 'keep-alive'})
+            session.mount('https://', _HTTP_ADAPTER)
+            
+            # Drop clients built from outdated versions of the credentials file
+            _CLIENT_CACHE.clear()
+            _CLIENT_CACHE[cache_key] = client
+        
+        refresh_credentials(client)
+    
+    return client
+
+def refresh_credentials(client: gspread.Client) -> None:
+    """Fetch a new access token for the client if it has none or it has expired"""
+    credentials = client.http_client.auth
+    if not credentials.valid:
+        with _API_CONCURRENCY:
+            credentials.refresh(_AUTH_REQUEST)
+
+def split_rows_by_size(rows: List[List[Any]], max_bytes: int) -> List[Tuple[int, List[List[Any]]]]:
+    """Split rows into consecutive chunks whose JSON encoding fits in max_bytes.
+    
+    Args:
+        rows: Rows of cell values, or columns for column-major data
+        max_bytes: Maximum serialized size of a chunk
+    
+    Returns:
+        List of (1-based start row or column, rows) tuples; a single chunk if everything fits
+    """
+    chunks = []
+    chunk: List[List[Any]] = []
+    chunk_start = 1
+    chunk_size = 0
+    
+    for row_idx, row in enumerate(rows, start=1):
+        try:
+            row_size = len(orjson.dumps(row))
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits; the repr is a close enough size estimate
+            row_size = len(repr(row))
+        if chunk and chunk_size + row_size > max_bytes:
+            chunks.append((chunk_start, chunk))
+            chunk = []
+            chunk_start = row_idx
+            chunk_size = 0
+        chunk.append(row)
+        chunk_size += row_size
+    
+    if chunk:
+        chunks.append((chunk_start, chunk))
+    return chunks
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_WRITE_LIMITER, idempotent=False)
+def create_spreadsheet(client: gspread.Client, title: str) -> gspread.Spreadsheet:
+    """Create a new spreadsheet"""
+    return client.create(title)
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_WRITE_LIMITER)
+def share_spreadsheet(spreadsheet: gspread.Spreadsheet, email: str) -> None:
+    """Give a user write access to a spreadsheet"""
+    spreadsheet.share(email, perm_type='user', role='writer')
+
+def validate_spreadsheet_ref(spreadsheet_url: Optional[str], spreadsheet_id: Optional[str]) -> Optional[str]:
+    """Check that exactly one valid spreadsheet URL or ID was given, returning the problem if not"""
+    if spreadsheet_url is None and spreadsheet_id is None:
+        return "Either spreadsheet_url or spreadsheet_id must be provided"
+    if spreadsheet_url is not None and spreadsheet_id is not None:
+        return "Only one of spreadsheet_url and spreadsheet_id may be provided"
+    if spreadsheet_id is not None:
+        if not isinstance(spreadsheet_id, str) or not _SHEET_KEY_RE.match(spreadsheet_id):
+            return "spreadsheet_id must be a valid Google Sheets spreadsheet ID"
+    elif not spreadsheet_url or not isinstance(spreadsheet_url, str):
+        return "spreadsheet_url must be a non-empty string"
+    elif not _SHEET_URL_RE.match(spreadsheet_url) or not _SHEET_ID_RE.search(spreadsheet_url):
+        return "spreadsheet_url must be a valid Google Sheets URL"
+    return None
+
+def extract_spreadsheet_id(spreadsheet_url: str) -> str:
+    """Extract the spreadsheet ID from a Google Sheets URL without calling the API"""
+    match = _SHEET_ID_RE.search(spreadsheet_url)
+    if not match:
+        raise gspread.exceptions.NoValidUrlKeyFound(f"No spreadsheet ID found in URL: {spreadsheet_url}")
+    return match.group(1)
+
+def drive_service(client: gspread.Client) -> Any:
+    """Build a Drive API service that uses the gspread client's credentials"""
+    return build('drive', 'v3', credentials=client.http_client.auth, cache_discovery=False)
+
+def create_spreadsheets_batch(client: gspread.Client, titles: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+    """Create several spreadsheets using Drive batch requests.
+    
+    Args:
+        client: Authorized gspread client whose credentials are used for Drive
+        titles: Names of the spreadsheets to create
+    
+    Returns:
+        A (spreadsheet ID, error) pair for each title, in order, with one of the two set.
+        If a whole batch fails, the titles it did not create get that error, while
+        the spreadsheets created by earlier batches are still returned
+    """
+    drive = drive_service(client)
+    results = [(None, None)] * len(titles)
+    
+    def collect_result(request_id, response, exception):
+        index = int(request_id)
+        results[index] = (None, str(exception)) if exception is not None else (response['id'], None)
+    
+    for start in range(0, len(titles), _DRIVE_BATCH_SIZE):
+        batch = drive.new_batch_http_request(callback=collect_result)
+        for index in range(start, min(start + _DRIVE_BATCH_SIZE, len(titles))):
+            batch.add(
+                drive.files().create(
+                    body={'name': titles[index], 'mimeType': gspread.utils.MimeType.google_sheets},
+                    fields='id',
+                    supportsAllDrives=True
+                ),
+                request_id=str(index)
+            )
+        # googleapiclient raises HttpError rather than gspread's APIError, so
+        # backoff_handler could not retry this, and repeating a create batch
+        # would duplicate spreadsheets anyway: only the rate limit applies
+        _WRITE_LIMITER.acquire()
+        try:
+            with _API_CONCURRENCY:
+                batch.execute()
+        except Exception as e:
+            for index in range(start, min(start + _DRIVE_BATCH_SIZE, len(titles))):
+                if results[index] == (None, None):
+                    results[index] = (None, f"batch request failed: {e}")
+    
+    return results
+
+def share_spreadsheets_batch(client: gspread.Client, shares: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """Give users write access to spreadsheets using Drive batch requests.
+    
+    Args:
+        client: Authorized gspread client whose credentials are used for Drive
+        shares: (spreadsheet ID, email) pairs to create writer permissions for
+    
+    Returns:
+        Dictionary mapping each pair that could not be shared to its error,
+        including the pairs of any batch that failed as a whole
+    """
+    drive = drive_service(client)
+    errors = {}
+    answered = set()
+    
+    # Deduplicate while keeping order, positions are used as batch request IDs
+    shares = list(dict.fromkeys(shares))
+    
+    def collect_error(request_id, response, exception):
+        answered.add(int(request_id))
+        if exception is not None:
+            errors[shares[int(request_id)]] = str(exception)
+    
+    for start in range(0, len(shares), _DRIVE_BATCH_SIZE):
+        batch = drive.new_batch_http_request(callback=collect_error)
+        for index in range(start, min(start + _DRIVE_BATCH_SIZE, len(shares))):
+            spreadsheet_id, email = shares[index]
+            batch.add(
+                drive.permissions().create(
+                    fileId=spreadsheet_id,
+                    body={'type': 'user', 'role': 'writer', 'emailAddress': email},
+                    fields='id',
+                    supportsAllDrives=True
+                ),
+                request_id=str(index)
+            )
+        # Drive errors are not retried by backoff_handler (see create_spreadsheets_batch)
+        _WRITE_LIMITER.acquire()
+        try:
+            with _API_CONCURRENCY:
+                batch.execute()
+        except Exception as e:
+            for index in range(start, min(start + _DRIVE_BATCH_SIZE, len(shares))):
+                if index not in answered:
+                    errors[shares[index]] = f"batch request failed: {e}"
+    
+    return errors
+
+def share_spreadsheet_batch(client: gspread.Client, spreadsheet: gspread.Spreadsheet,
+                            emails: List[str]) -> Dict[str, str]:
+    """Give several users write access to a spreadsheet using Drive batch requests.
+    
+    Args:
+        client: Authorized gspread client whose credentials are used for Drive
+        spreadsheet: Spreadsheet to share
+        emails: Email addresses to share the spreadsheet with
+    
+    Returns:
+        Dictionary mapping each email that could not be shared with to its error
+    """
+    errors = share_spreadsheets_batch(client, [(spreadsheet.id, email) for email in emails])
+    return {email: error for (_, email), error in errors.items()}
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_READ_LIMITER)
+def fetch_spreadsheet(client: gspread.Client, spreadsheet_id: str) -> gspread.Spreadsheet:
+    """Open a spreadsheet by its ID"""
+    return client.open_by_key(spreadsheet_id)
+
+def read_cache_get(cache_key: Tuple[str, Optional[str], bool], ttl: float) -> Optional[Dict[str, Any]]:
+    """Return a cached get_google_sheet result if it is younger than ttl seconds"""
+    with _READ_CACHE_LOCK:
+        entry = _READ_CACHE.get(cache_key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            _READ_CACHE.move_to_end(cache_key)
+            return entry[1]
+    return None
+
+def read_cache_put(cache_key: Tuple[str, Optional[str], bool], result: Dict[str, Any]) -> None:
+    """Cache a get_google_sheet result, evicting the least recently used results"""
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[cache_key] = (time.monotonic(), result)
+        _READ_CACHE.move_to_end(cache_key)
+        while len(_READ_CACHE) > _READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
+
+def read_cache_invalidate(spreadsheet_id: str) -> None:
+    """Drop all cached get_google_sheet results of a spreadsheet"""
+    with _READ_CACHE_LOCK:
+        for cache_key in [key for key in _READ_CACHE if key[0] == spreadsheet_id]:
+            del _READ_CACHE[cache_key]
+
+def metadata_cache_get(cache: OrderedDict, key: Any) -> Any:
+    """Return a value from a metadata cache, or None if it is missing or expired"""
+    with _METADATA_CACHE_LOCK:
+        entry = cache.get(key)
+        if entry and time.monotonic() - entry[0] < _METADATA_CACHE_TTL:
+            cache.move_to_end(key)
+            return entry[1]
+    return None
+
+def metadata_cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    """Store a value in a metadata cache, evicting the least recently used entries"""
+    with _METADATA_CACHE_LOCK:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > _METADATA_CACHE_SIZE:
+            cache.popitem(last=False)
+
+def open_spreadsheet(client: gspread.Client, spreadsheet_id: str) -> gspread.Spreadsheet:
+    """Open a spreadsheet by its ID, reusing it if it was opened recently"""
+    cache_key = (client, spreadsheet_id)
+    
+    spreadsheet = metadata_cache_get(_SPREADSHEET_CACHE, cache_key)
+    if spreadsheet is None:
+        spreadsheet = fetch_spreadsheet(client, spreadsheet_id)
+        metadata_cache_put(_SPREADSHEET_CACHE, cache_key, spreadsheet)
+    
+    return spreadsheet
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_READ_LIMITER)
+def fetch_worksheets(spreadsheet: gspread.Spreadsheet) -> Dict[str, gspread.Worksheet]:
+    """Get all worksheets of a spreadsheet by title, in sheet order"""
+    return {worksheet.title: worksheet for worksheet in spreadsheet.worksheets()}
+
+def find_worksheet(spreadsheet: gspread.Spreadsheet,
+                   worksheet_name: Optional[str] = None) -> Optional[gspread.Worksheet]:
+    """Get a worksheet by title, reusing the spreadsheet's recently fetched worksheets.
+    
+    Args:
+        spreadsheet: Spreadsheet to look in
+        worksheet_name: Title of the worksheet, or None for the first worksheet
+    
+    Returns:
+        The worksheet, or None if there is no worksheet with that title
+    """
+    cache_key = (spreadsheet.client, spreadsheet.id)
+    worksheets = metadata_cache_get(_WORKSHEET_CACHE, cache_key)
+    # A title missing from the cache may belong to a tab added since, so ask the API before giving up
+    if not worksheets or (worksheet_name is not None and worksheet_name not in worksheets):
+        worksheets = fetch_worksheets(spreadsheet)
+        metadata_cache_put(_WORKSHEET_CACHE, cache_key, worksheets)
+    
+    if worksheet_name is None:
+        return next(iter(worksheets.values()), None)
+    return worksheets.get(worksheet_name)
+
+def remember_worksheet(spreadsheet: gspread.Spreadsheet, worksheet: gspread.Worksheet) -> None:
+    """Add a newly created worksheet to the spreadsheet's cached worksheets"""
+    cache_key = (spreadsheet.client, spreadsheet.id)
+    with _METADATA_CACHE_LOCK:
+        entry = _WORKSHEET_CACHE.get(cache_key)
+        if entry:
+            entry[1][worksheet.title] = worksheet
+
+def forget_worksheets(spreadsheet: gspread.Spreadsheet) -> None:
+    """Drop the spreadsheet's cached worksheets, e.g. after a call on one of them failed"""
+    with _METADATA_CACHE_LOCK:
+        _WORKSHEET_CACHE.pop((spreadsheet.client, spreadsheet.id), None)
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_WRITE_LIMITER, idempotent=False)
+def add_worksheet(spreadsheet: gspread.Spreadsheet, title: str, rows: int, cols: int) -> gspread.Worksheet:
+    """Add a worksheet to a spreadsheet and remember it for later lookups"""
+    worksheet = spreadsheet.add_worksheet(title=title, rows=rows, cols=cols)
+    remember_worksheet(spreadsheet, worksheet)
+    return worksheet
+
+def chunk_start_cell(start: int, major_dimension: str) -> str:
+    """A1 cell a chunk is written from: column A of row start, or row 1 of column start"""
+    return f'A{start}' if major_dimension == 'ROWS' else gspread.utils.rowcol_to_a1(1, start)
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_WRITE_LIMITER)
+def worksheet_update_data(worksheet: gspread.Worksheet, data: List[List[Any]], start: int,
+                          major_dimension: str = 'ROWS') -> Any:
+    """Write rows (or columns) of values and formulas to a worksheet starting at row (or column) start"""
+    # USER_ENTERED makes the API parse strings starting with '=' as formulas
+    return worksheet.update(values=data, range_name=chunk_start_cell(start, major_dimension),
+                            value_input_option='USER_ENTERED', major_dimension=major_dimension)
+
+def formatting_requests(sheet_id: int, set_basic_filter: bool, freeze_rows: Optional[int],
+                        bold_header_cols: int) -> List[Dict[str, Any]]:
+    """Build the batch update requests for a basic filter, frozen rows and bold header"""
+    requests = []
+    if set_basic_filter:
+        requests.append({'setBasicFilter': {'filter': {'range': {'sheetId': sheet_id}}}})
+    if freeze_rows:
+        requests.append({'updateSheetProperties': {
+            'properties': {'sheetId': sheet_id, 'gridProperties': {'frozenRowCount': freeze_rows}},
+            'fields': 'gridProperties.frozenRowCount'
+        }})
+    if bold_header_cols:
+        requests.append({'repeatCell': {
+            'range': {'sheetId': sheet_id, 'startRowIndex': 0, 'endRowIndex': 1,
+                      'startColumnIndex': 0, 'endColumnIndex': bold_header_cols},
+            'cell': {'userEnteredFormat': {'textFormat': {'bold': True}}},
+            'fields': 'userEnteredFormat.textFormat.bold'
+        }})
+    return requests
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_WRITE_LIMITER)
+def spreadsheet_update_values(client: gspread.Client, spreadsheet_id: str, data: List[List[Any]],
+                              start: int, major_dimension: str = 'ROWS') -> Any:
+    """Write rows (or columns) to the first worksheet of a spreadsheet starting at row (or column) start"""
+    return client.http_client.values_update(
+        spreadsheet_id, chunk_start_cell(start, major_dimension),
+        params={'valueInputOption': 'USER_ENTERED'},
+        body={'values': data, 'majorDimension': major_dimension}
+    )
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_WRITE_LIMITER)
+def spreadsheet_batch_update(client: gspread.Client, spreadsheet_id: str, requests: List[Dict[str, Any]]) -> Any:
+    """Send a batch update to a spreadsheet by ID"""
+    return client.http_client.batch_update(spreadsheet_id, {'requests': requests})
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_WRITE_LIMITER)
+def worksheet_apply_formatting(worksheet: gspread.Worksheet, set_basic_filter: bool,
+                               freeze_rows: Optional[int], bold_header_cols: int) -> Any:
+    """Apply the basic filter, frozen rows and bold header in one batch update.
+    
+    Args:
+        worksheet: Worksheet to format
+        set_basic_filter: Whether to set a basic filter on the whole worksheet
+        freeze_rows: Number of top rows to freeze, nothing is frozen if falsy
+        bold_header_cols: Number of header row cells to make bold, none if 0
+    
+    Returns:
+        The batch update response, or None if there was nothing to apply
+    """
+    requests = formatting_requests(worksheet.id, set_basic_filter, freeze_rows, bold_header_cols)
+    if not requests:
+        return None
+    return worksheet.spreadsheet.batch_update({'requests': requests})
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_READ_LIMITER)
+def get_worksheet_data(worksheet: gspread.Worksheet, formatted_values: bool = False) -> List[List[Any]]:
+    """Get all values from a worksheet, as raw numbers and booleans unless formatted_values is set"""
+    if formatted_values:
+        return worksheet.get_all_values()
+    # Unformatted values skip server-side rendering and keep numbers typed; dates
+    # stay human readable instead of becoming serial numbers
+    return worksheet.get_all_values(
+        value_render_option=gspread.utils.ValueRenderOption.unformatted,
+        date_time_render_option=gspread.utils.DateTimeOption.formatted_string
+    )
+
+@backoff_handler(max_retries=5, initial_delay=1.0, rate_limiter=_READ_LIMITER)
+def fetch_spreadsheet_files_page(client: gspread.Client, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Fetch one page of spreadsheet files from the Drive API"""
+    return client.http_client.request("get", gspread.urls.DRIVE_FILES_API_V3_URL, params=params).json()
+
+def list_spreadsheets(client: gspread.Client, title: Optional[str] = None,
+                      folder_id: Optional[str] = None,
+                      max_results: Optional[int] = None) -> Tuple[List[Dict[str, Any]], bool]:
+    """List the spreadsheets the service account has access to.
+    
+    Pages through the Drive API only until max_results spreadsheets are found
+    (all of them if None). Returns the spreadsheets and whether more exist.
+    """
+    query = f'mimeType="{gspread.utils.MimeType.google_sheets}"'
+    if title:
+        query += f' and name = "{title}"'
+    if folder_id:
+        query += f' and parents in "{folder_id}"'
+    
+    params = {
+        "q": query,
+        "pageSize": min(max_results, _DRIVE_PAGE_SIZE) if max_results else _DRIVE_PAGE_SIZE,
+        "supportsAllDrives": True,
+        "includeItemsFromAllDrives": True,
+        "fields": "nextPageToken,files(id,name,createdTime,modifiedTime)",
+    }
+    
+    sheet_list = []
+    while True:
+        page = fetch_spreadsheet_files_page(client, params)
+        for sheet in page.get("files", []):
+            # Construct the URL from the ID
+            url = f"https://docs.google.com/spreadsheets/d/{sheet['id']}"
+            
+            sheet_list.append({
+                "id": sheet['id'],
+                "title": sheet['name'],
+                "url": url,
+                "created_time": sheet.get('createdTime', ''),
+                "modified_time": sheet.get('modifiedTime', '')
+            })
+        
+        page_token = page.get("nextPageToken")
+        if max_results is not None and len(sheet_list) >= max_results:
+            return sheet_list[:max_results], bool(page_token) or len(sheet_list) > max_results
+        if not page_token:
+            return sheet_list, False
+        params["pageToken"] = page_token
 
 @mcp.tool()
 async def create_google_sheet(
     title: str,
-    share_with: str,
+    share_with: Union[str, List[str]],
     ctx: Context = None
 ) -> Dict[str, Union[str, List[str]]]:
     """Create a new Google Sheet.
     
     Args:
         title: Name of the spreadsheet
-        share_with: Email address to share the spreadsheet with (must be a valid email)
+        share_with: Email address or list of email addresses to share the spreadsheet with (must be valid emails)
     
     Returns:
         Dictionary containing status, message and spreadsheet URL
@@ -83,8 +759,10 @@ async def create_google_sheet(
         validation_errors.append("Title must be a non-empty string")
     
     # Validate share_with
-    if not share_with or not isinstance(share_with, str):
-        validation_errors.append("share_with must be a non-empty string with a valid email address")
+    emails = [share_with] if isinstance(share_with, str) else share_with
+    if (not share_with or not isinstance(emails, list)
+            or not all(isinstance(email, str) and _EMAIL_RE.match(email) for email in emails)):
+        validation_errors.append("share_with must be a valid email address or a non-empty list of valid email addresses")
     
     if validation_errors:
         return {
@@ -93,13 +771,23 @@ async def create_google_sheet(
         }
     
     try:
-        client = init_gspread_client()
+        client = await run_blocking(init_gspread_client)
         
         # Create a new spreadsheet
-        spreadsheet = client.create(title)
+        spreadsheet = await run_blocking(create_spreadsheet, client, title)
         
-        # Share the spreadsheet with the provided email
-        spreadsheet.share(share_with, perm_type='user', role='writer')
+        # Share the spreadsheet with the provided emails
+        if len(emails) == 1:
+            await run_blocking(share_spreadsheet, spreadsheet, emails[0])
+        else:
+            share_errors = await run_blocking(share_spreadsheet_batch, client, spreadsheet, emails)
+            if share_errors:
+                return {
+                    "status": "partial_success",
+                    "message": f"Spreadsheet '{title}' created but sharing failed for: " +
+                               "; ".join(f"{email}: {error}" for email, error in share_errors.items()),
+                    "spreadsheet_url": spreadsheet.url
+                }
         
         return {
             "status": "success",
@@ -113,25 +801,189 @@ async def create_google_sheet(
             "message": f"Error creating spreadsheet: {str(e)}"
         }
 
+async def fill_new_spreadsheet(client: gspread.Client, spreadsheet_id: str, sheet: Dict[str, Any]) -> None:
+    """Write the requested rows and formatting to the first worksheet of a new spreadsheet"""
+    data = sheet['data_and_formulas']
+    major_dimension = sheet.get('major_dimension', 'ROWS')
+    for start, chunk in split_rows_by_size(data, _MAX_WRITE_PAYLOAD_BYTES):
+        await run_blocking(spreadsheet_update_values, client, spreadsheet_id, chunk, start, major_dimension)
+    
+    # The first worksheet of a new spreadsheet always has sheet ID 0
+    header_cols = len(data[0]) if major_dimension == 'ROWS' else len(data)
+    bold_header_cols = header_cols if sheet.get('set_bold_header', True) else 0
+    requests = formatting_requests(0, sheet.get('set_basic_filter', True),
+                                   sheet.get('freeze_rows', 1), bold_header_cols)
+    if requests:
+        await run_blocking(spreadsheet_batch_update, client, spreadsheet_id, requests)
+
+@mcp.tool()
+async def batch_create_google_sheets(
+    sheets: List[Dict[str, Any]],
+    ctx: Context = None
+) -> Dict[str, Union[str, List[Dict[str, str]]]]:
+    """Create several Google Sheets at once, optionally filling them with data.
+    
+    All spreadsheets are created in one Drive batch request and shared in another,
+    then their data is written concurrently.
+    
+    Args:
+        sheets: Spreadsheets to create, each a dictionary with:
+            - title: Name of the spreadsheet
+            - share_with: Email address or list of email addresses to share the spreadsheet with
+            - data_and_formulas: Optional list of lists of rows for the first worksheet, strings starting with '=' are formulas
+            - major_dimension: 'ROWS' (default) or 'COLUMNS' if data_and_formulas is a list of columns
+            - set_basic_filter: Whether to set a basic filter when data is written (default True)
+            - freeze_rows: Number of rows to freeze when data is written (default 1)
+            - set_bold_header: Whether to make the header row bold when data is written (default True)
+    
+    Returns:
+        Dictionary containing status, message and, for each requested spreadsheet in order,
+        its title, status, message and spreadsheet URL
+    """
+    # Input validation
+    validation_errors = []
+    
+    if not sheets or not isinstance(sheets, list):
+        validation_errors.append("sheets must be a non-empty list")
+    else:
+        for index, sheet in enumerate(sheets):
+            if not isinstance(sheet, dict):
+                validation_errors.append(f"sheets[{index}] must be a dictionary")
+                continue
+            
+            title = sheet.get('title')
+            if not title or not isinstance(title, str):
+                validation_errors.append(f"sheets[{index}]: title must be a non-empty string")
+            
+            share_with = sheet.get('share_with')
+            emails = [share_with] if isinstance(share_with, str) else share_with
+            if (not share_with or not isinstance(emails, list)
+                    or not all(isinstance(email, str) and _EMAIL_RE.match(email) for email in emails)):
+                validation_errors.append(f"sheets[{index}]: share_with must be a valid email address "
+                                         "or a non-empty list of valid email addresses")
+            
+            # Entries are untyped, so check types before any set lookups
+            major_dimension = sheet.get('major_dimension', 'ROWS')
+            if not isinstance(major_dimension, str) or major_dimension not in _MAJOR_DIMENSIONS:
+                validation_errors.append(f"sheets[{index}]: major_dimension must be 'ROWS' or 'COLUMNS'")
+            for option in ('set_basic_filter', 'set_bold_header'):
+                if not isinstance(sheet.get(option, True), bool):
+                    validation_errors.append(f"sheets[{index}]: {option} must be a boolean")
+            freeze_rows = sheet.get('freeze_rows', 1)
+            if freeze_rows is not None and (not isinstance(freeze_rows, int) or isinstance(freeze_rows, bool)
+                                            or freeze_rows < 0):
+                validation_errors.append(f"sheets[{index}]: freeze_rows must be a non-negative integer")
+            
+            data = sheet.get('data_and_formulas')
+            if data is None:
+                continue
+            if not data or not isinstance(data, list) or not all(isinstance(row, list) for row in data):
+                validation_errors.append(f"sheets[{index}]: data_and_formulas must be a non-empty list of lists")
+            elif not all(_CELL_TYPES.issuperset(map(type, row)) for row in data):
+                validation_errors.append(f"sheets[{index}]: each cell in data must be a string, number or boolean")
+    
+    if validation_errors:
+        return {
+            "status": "error",
+            "message": "; ".join(validation_errors)
+        }
+    
+    try:
+        client = await run_blocking(init_gspread_client)
+        
+        # Create every spreadsheet in one Drive batch
+        created = await run_blocking(create_spreadsheets_batch, client, [sheet['title'] for sheet in sheets])
+        
+        # Share all created spreadsheets in another batch
+        shares = []
+        for sheet, (spreadsheet_id, _) in zip(sheets, created):
+            if spreadsheet_id:
+                emails = [sheet['share_with']] if isinstance(sheet['share_with'], str) else sheet['share_with']
+                shares.extend((spreadsheet_id, email) for email in emails)
+        try:
+            share_errors = await run_blocking(share_spreadsheets_batch, client, shares) if shares else {}
+        except Exception as e:
+            # The spreadsheets exist by now, so report them rather than failing the whole call
+            share_errors = {share: str(e) for share in shares}
+        
+        # Write the data of each spreadsheet concurrently
+        to_fill = [(spreadsheet_id, sheet) for sheet, (spreadsheet_id, _) in zip(sheets, created)
+                   if spreadsheet_id and sheet.get('data_and_formulas')]
+        fill_results = await asyncio.gather(
+            *(fill_new_spreadsheet(client, spreadsheet_id, sheet) for spreadsheet_id, sheet in to_fill),
+            return_exceptions=True
+        )
+        fill_errors = {spreadsheet_id: str(result) for (spreadsheet_id, _), result in zip(to_fill, fill_results)
+                       if isinstance(result, Exception)}
+        
+        results = []
+        for sheet, (spreadsheet_id, create_error) in zip(sheets, created):
+            if not spreadsheet_id:
+                results.append({
+                    "title": sheet['title'],
+                    "status": "error",
+                    "message": f"Error creating spreadsheet: {create_error}"
+                })
+                continue
+            
+            problems = [f"sharing failed for {email}: {error}"
+                        for (shared_id, email), error in share_errors.items() if shared_id == spreadsheet_id]
+            if spreadsheet_id in fill_errors:
+                problems.append(f"writing data failed: {fill_errors[spreadsheet_id]}")
+            results.append({
+                "title": sheet['title'],
+                "status": "partial_success" if problems else "success",
+                "message": (f"Spreadsheet '{sheet['title']}' created but " + "; ".join(problems)) if problems
+                           else f"Spreadsheet '{sheet['title']}' created successfully",
+                "spreadsheet_url": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
+            })
+        
+        succeeded = sum(result["status"] == "success" for result in results)
+        failed = sum(result["status"] == "error" for result in results)
+        if ctx:
+            await ctx.info(f"Created {len(results) - failed} of {len(results)} spreadsheets, "
+                           f"{len(to_fill) - len(fill_errors)} filled with data")
+        
+        return {
+            "status": "success" if succeeded == len(results) else "error" if failed == len(results) else "partial_success",
+            "message": f"{succeeded} of {len(results)} spreadsheets created successfully",
+            "spreadsheets": results
+        }
+    
+    except Exception as e:
+        error_msg = f"Error creating spreadsheets: {str(e)}"
+        if ctx:
+            await ctx.error(error_msg)
+        
+        return {
+            "status": "error",
+            "message": error_msg
+        }
+
 @mcp.tool()
 async def update_google_sheet(
-    spreadsheet_url: str,
+    spreadsheet_url: Optional[str] = None,
+    *,
     data_and_formulas: List[List[Union[str, int, float, bool]]],
     worksheet_name: Optional[str] = "Sheet1",
     set_basic_filter: Optional[bool] = True,
     freeze_rows: Optional[int] = 1,
     set_bold_header: Optional[bool] = True,
+    spreadsheet_id: Optional[str] = None,
+    major_dimension: str = "ROWS",
     ctx: Context = None
 ) -> Dict[str, Union[str, List[str]]]:
     """Update a Google Sheet with the specified data and formulas.
     
     Args:
-        spreadsheet_url: URL of the spreadsheet to update (must be a valid Google Sheets URL)
+        spreadsheet_url: URL of the spreadsheet to update (must be a valid Google Sheets URL, or use spreadsheet_id)
+        spreadsheet_id: ID of the spreadsheet to update, as found in its URL (instead of spreadsheet_url)
         worksheet_name: Name of the worksheet to update or create (uses first sheet if None)
-        data_and_formulas: List of lists representing rows and columns of data. Any string starting with '=' will be treated as a formula (e.g. '=SUM(A1:A5)')
+        data_and_formulas: List of lists representing rows and columns of data. Values are written once, as if typed into the sheet: any string starting with '=' will be treated as a formula (e.g. '=SUM(A1:A5)')
         set_basic_filter: Whether to set a basic filter on the worksheet
         freeze_rows: Number of rows to freeze
         set_bold_header: Whether to set the header row to bold
+        major_dimension: 'ROWS' if data_and_formulas is a list of rows (default), 'COLUMNS' if it is a list of columns
     
     Returns:
         Dictionary containing status, message and spreadsheet URL
@@ -139,20 +991,25 @@ async def update_google_sheet(
     # Input validation
     validation_errors = []
     
-    # Validate spreadsheet_url
-    if not spreadsheet_url or not isinstance(spreadsheet_url, str):
-        validation_errors.append("spreadsheet_url must be a non-empty string")
+    # Validate spreadsheet_url or spreadsheet_id
+    spreadsheet_error = validate_spreadsheet_ref(spreadsheet_url, spreadsheet_id)
+    if spreadsheet_error:
+        validation_errors.append(spreadsheet_error)
     
     # Validate data
     if not data_and_formulas:
         validation_errors.append("Data must not be empty")
     elif not isinstance(data_and_formulas, list):
         validation_errors.append("Data must be a list of lists")
-    else:
-        for row in data_and_formulas:
-            if not isinstance(row, list):
-                validation_errors.append("Each row in data must be a list")
-                break
+    elif not all(isinstance(row, list) for row in data_and_formulas):
+        validation_errors.append("Each row in data must be a list")
+    # Reject bad cells up front so the sheet is never partially written
+    elif not all(_CELL_TYPES.issuperset(map(type, row)) for row in data_and_formulas):
+        validation_errors.append("Each cell in data must be a string, number or boolean")
+    
+    # Validate major_dimension
+    if not isinstance(major_dimension, str) or major_dimension not in _MAJOR_DIMENSIONS:
+        validation_errors.append("major_dimension must be 'ROWS' or 'COLUMNS'")
     
     if validation_errors:
         return {
@@ -161,14 +1018,22 @@ async def update_google_sheet(
         }
     
     try:
-        if ctx:
-            await ctx.info(f"Opening spreadsheet from URL: {spreadsheet_url}")
+        client = await run_blocking(init_gspread_client)
         
-        client = init_gspread_client()
-        
-        # Open the spreadsheet by URL
+        # Open the spreadsheet by ID, taken from the URL if needed
         try:
-            spreadsheet = client.open_by_url(spreadsheet_url)
+            spreadsheet_id = spreadsheet_id or extract_spreadsheet_id(spreadsheet_url)
+            spreadsheet = await run_blocking(open_spreadsheet, client, spreadsheet_id)
+        except gspread.exceptions.SpreadsheetNotFound:
+            return {
+                "status": "error",
+                "message": "Spreadsheet not found"
+            }
+        except PermissionError:
+            return {
+                "status": "error",
+                "message": "Permission denied: share the spreadsheet with the service account"
+            }
         except Exception as e:
             return {
                 "status": "error",
@@ -177,112 +1042,45 @@ async def update_google_sheet(
         
         # Get or create the specified worksheet
         if worksheet_name:
-            if ctx:
-                await ctx.info(f"Looking for worksheet: {worksheet_name}")
-            
             # Try to get the worksheet by name
-            worksheet = None
-            for ws in spreadsheet.worksheets():
-                if ws.title == worksheet_name:
-                    worksheet = ws
-                    break
+            worksheet = await run_blocking(find_worksheet, spreadsheet, worksheet_name)
             
             # Create it if it doesn't exist
-            if not worksheet:
-                if ctx:
-                    await ctx.info(f"Creating new worksheet: {worksheet_name}")
-                worksheet = spreadsheet.add_worksheet(title=worksheet_name, 
-                                                     rows=len(data_and_formulas), 
-                                                     cols=len(data_and_formulas[0]) if data_and_formulas and data_and_formulas[0] else 1)
+            created_worksheet = not worksheet
+            if created_worksheet:
+                # Size the worksheet to the data, which may be given as columns
+                outer, inner = len(data_and_formulas), len(data_and_formulas[0]) or 1
+                rows, cols = (outer, inner) if major_dimension == 'ROWS' else (inner, outer)
+                worksheet = await run_blocking(add_worksheet, spreadsheet, worksheet_name, rows, cols)
         else:
             # Use the first worksheet
-            worksheet = spreadsheet.get_worksheet(0)
-            if ctx:
-                await ctx.info(f"Using first worksheet: {worksheet.title}")
+            worksheet = await run_blocking(find_worksheet, spreadsheet)
+            created_worksheet = False
         
-        # Update the worksheet with data
-        if ctx:
-            await ctx.info(f"Updating worksheet with {len(data_and_formulas)} rows of data")
-        
-        # Process data to handle formulas correctly
-        # We need to separate regular data from formulas
-        regular_data = []
-        formulas = {}
-        
-        # First pass: collect regular data and identify formulas
-        for row_idx, row in enumerate(data_and_formulas):
-            new_row = []
-            for col_idx, cell_value in enumerate(row):
-                # Check if the cell value is a formula (starts with '=')
-                if isinstance(cell_value, str) and cell_value.startswith('='):
-                    # Convert to A1 notation (e.g., A1, B2, etc.)
-                    col_letter = chr(65 + col_idx)  # A, B, C, etc.
-                    cell_ref = f"{col_letter}{row_idx+1}"
-                    formulas[cell_ref] = cell_value
-                    # Use a placeholder in the regular data
-                    new_row.append('')
-                else:
-                    new_row.append(cell_value)
-            regular_data.append(new_row)
-        
-        # Apply backoff to worksheet update
-        @backoff_handler(max_retries=5, initial_delay=1.0)
-        def worksheet_update_data(worksheet, data):
-            return worksheet.update(data)
-
-        @backoff_handler(max_retries=5, initial_delay=1.0)
-        def worksheet_set_basic_filter(worksheet):
-            return worksheet.set_basic_filter()
-        
-        @backoff_handler(max_retries=5, initial_delay=1.0)
-        def worksheet_freeze_rows(worksheet, rows):
-            return worksheet.freeze(rows)
-        
-        @backoff_handler(max_retries=5, initial_delay=1.0)
-        def worksheet_set_bold_header(worksheet, cols_num):
-            return worksheet.format('A1:' + chr(64 + cols_num) + '1', {'textFormat': {'bold': True}})
-
-        # Update with regular data first
-        worksheet_update_data(worksheet, regular_data)
-        if set_basic_filter:
-            worksheet_set_basic_filter(worksheet)
-        if freeze_rows:
-            worksheet_freeze_rows(worksheet, freeze_rows)
-        if set_bold_header:
-            worksheet_set_bold_header(worksheet, len(regular_data[0]))
-        
-        # Then apply formulas if there are any
-        if formulas:
-            if ctx:
-                await ctx.info(f"Applying {len(formulas)} formulas")
-            
-            # Apply backoff to formula updates
-            @backoff_handler(max_retries=3, initial_delay=1.0)
-            def update_cell_formula(worksheet, cell_ref, formula):
-                return worksheet.update_acell(cell_ref, formula)
-            
-            formula_errors = []
-            for cell_ref, formula in formulas.items():
-                try:
-                    update_cell_formula(worksheet, cell_ref, formula)
-                except Exception as formula_error:
-                    error_msg = f"Error applying formula to {cell_ref}: {str(formula_error)}"
-                    formula_errors.append(error_msg)
-                    if ctx:
-                        await ctx.warning(error_msg)
+        # Write data and formulas in as few requests as the payload limit allows.
+        # Retried calls run in a worker thread so backoff sleeps don't block the event loop
+        chunks = split_rows_by_size(data_and_formulas, _MAX_WRITE_PAYLOAD_BYTES)
+        header_cols = len(data_and_formulas[0]) if major_dimension == 'ROWS' else len(data_and_formulas)
+        bold_header_cols = header_cols if set_bold_header else 0
+        try:
+            for start, chunk in chunks:
+                await run_blocking(worksheet_update_data, worksheet, chunk, start, major_dimension)
             
-            if formula_errors and len(formula_errors) == len(formulas):
-                return {
-                    "status": "partial_success",
-                    "message": f"Data updated but all formulas failed: {'; '.join(formula_errors)}",
-                    "spreadsheet_url": spreadsheet.url
-                }
-            elif formula_errors:
-                return {
-                    "status": "partial_success",
-                    "message": f"Data updated but some formulas failed: {'; '.join(formula_errors)}",
-                    "spreadsheet_url": spreadsheet.url
-                }
+            # Apply filter, frozen rows and header formatting in a single request
+            await run_blocking(worksheet_apply_formatting, worksheet, set_basic_filter,
+                               freeze_rows, bold_header_cols)
+        except gspread.exceptions.APIError:
+            # The cached worksheet may have been renamed or deleted since it was fetched
+            forget_worksheets(spreadsheet)
+            raise
+        
+        # Cached reads of this spreadsheet are now stale
+        read_cache_invalidate(spreadsheet.id)
+        
+        # Report progress once per call, each log message is a round trip to the client
+        if ctx:
+            await ctx.info(f"Wrote {len(data_and_formulas)} {major_dimension.lower()} in {len(chunks)} request(s) to "
+                           f"{'new' if created_worksheet else 'existing'} worksheet '{worksheet.title}'")
         
         return {
             "status": "success",
@@ -302,15 +1100,21 @@ async def update_google_sheet(
 
 @mcp.tool()
 async def get_google_sheet(
-    spreadsheet_url: str,
+    spreadsheet_url: Optional[str] = None,
     worksheet_name: Optional[str] = None,
+    formatted_values: bool = False,
+    cache_ttl: Optional[int] = None,
+    spreadsheet_id: Optional[str] = None,
     ctx: Context = None
 ) -> Dict[str, Union[str, List[List[Union[str, int, float, bool]]]]]:
     """Get all data from a Google Sheet.
     
     Args:
-        spreadsheet_url: URL of the spreadsheet to get (must be a valid Google Sheets URL)
+        spreadsheet_url: URL of the spreadsheet to get (must be a valid Google Sheets URL, or use spreadsheet_id)
+        spreadsheet_id: ID of the spreadsheet to get, as found in its URL (instead of spreadsheet_url)
         worksheet_name: Name of the worksheet to get (if None, the first worksheet will be returned)
+        formatted_values: Whether to return cell values as displayed strings instead of raw numbers and booleans
+        cache_ttl: Optional number of seconds a previously retrieved result may be reused for (no caching if None)
     
     Returns:
         Dictionary containing status, message, spreadsheet URL, worksheet name, and the data as a list of lists
@@ -318,9 +1122,14 @@ async def get_google_sheet(
     # Input validation
     validation_errors = []
     
-    # Validate spreadsheet_url
-    if not spreadsheet_url or not isinstance(spreadsheet_url, str):
-        validation_errors.append("spreadsheet_url must be a non-empty string")
+    # Validate spreadsheet_url or spreadsheet_id
+    spreadsheet_error = validate_spreadsheet_ref(spreadsheet_url, spreadsheet_id)
+    if spreadsheet_error:
+        validation_errors.append(spreadsheet_error)
+    
+    # Validate cache_ttl
+    if cache_ttl is not None and (not isinstance(cache_ttl, int) or cache_ttl < 0):
+        validation_errors.append("cache_ttl must be a non-negative integer")
     
     if validation_errors:
         return {
@@ -328,72 +1137,85 @@ async def get_google_sheet(
             "message": "; ".join(validation_errors)
         }
     
-    try:
-        if ctx:
-            await ctx.info(f"Opening spreadsheet from URL: {spreadsheet_url}")
-        
-        client = init_gspread_client()
+    # Serve recent results from the cache, letting only one caller fetch on a miss
+    spreadsheet_id = spreadsheet_id or extract_spreadsheet_id(spreadsheet_url)
+    cache_key = (spreadsheet_id, worksheet_name, formatted_values)
+    cache_lock = contextlib.nullcontext()
+    if cache_ttl:
+        cache_lock = _READ_CACHE_KEY_LOCKS.get(cache_key)
+        if cache_lock is None:
+            cache_lock = _READ_CACHE_KEY_LOCKS[cache_key] = asyncio.Lock()
+    
+    async with cache_lock:
+        if cache_ttl:
+            cached = read_cache_get(cache_key, cache_ttl)
+            if cached:
+                return {**cached, "message": "Spreadsheet data retrieved from cache"}
         
-        # Open the spreadsheet by URL
         try:
-            spreadsheet = client.open_by_url(spreadsheet_url)
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": f"Could not open spreadsheet: {str(e)}"
-            }
-        
-        # Get the specified worksheet or the first one
-        if worksheet_name:
-            if ctx:
-                await ctx.info(f"Looking for worksheet: {worksheet_name}")
+            client = await run_blocking(init_gspread_client)
             
-            # Try to get the worksheet by name
-            worksheet = None
-            for ws in spreadsheet.worksheets():
-                if ws.title == worksheet_name:
-                    worksheet = ws
-                    break
-            
-            if not worksheet:
+            # Open the spreadsheet by ID
+            try:
+                spreadsheet = await run_blocking(open_spreadsheet, client, spreadsheet_id)
+            except gspread.exceptions.SpreadsheetNotFound:
                 return {
                     "status": "error",
-                    "message": f"Worksheet '{worksheet_name}' not found"
+                    "message": "Spreadsheet not found"
                 }
-        else:
-            # Use the first worksheet
-            worksheet = spreadsheet.get_worksheet(0)
+            except PermissionError:
+                return {
+                    "status": "error",
+                    "message": "Permission denied: share the spreadsheet with the service account"
+                }
+            except Exception as e:
+                return {
+                    "status": "error",
+                    "message": f"Could not open spreadsheet: {str(e)}"
+                }
+            
+            # Get the specified worksheet or the first one
+            if worksheet_name:
+                # Try to get the worksheet by name
+                worksheet = await run_blocking(find_worksheet, spreadsheet, worksheet_name)
+                if not worksheet:
+                    return {
+                        "status": "error",
+                        "message": f"Worksheet '{worksheet_name}' not found"
+                    }
+            else:
+                # Use the first worksheet
+                worksheet = await run_blocking(find_worksheet, spreadsheet)
+            
+            try:
+                data = await run_blocking(get_worksheet_data, worksheet, formatted_values)
+            except gspread.exceptions.APIError:
+                # The cached worksheet may have been renamed or deleted since it was fetched
+                forget_worksheets(spreadsheet)
+                raise
             if ctx:
-                await ctx.info(f"Using first worksheet: {worksheet.title}")
-        
-        # Get all values from the worksheet
-        if ctx:
-            await ctx.info(f"Retrieving data from worksheet")
-        
-        # Apply backoff to worksheet data retrieval
-        @backoff_handler(max_retries=5, initial_delay=1.0)
-        def get_worksheet_data(worksheet):
-            return worksheet.get_all_values()
-        
-        data = get_worksheet_data(worksheet)
-        
-        return {
-            "status": "success",
-            "message": f"Spreadsheet data retrieved successfully",
-            "data": data,
-            "spreadsheet_url": spreadsheet.url,
-            "worksheet_name": worksheet.title
-        }
-        
-    except Exception as e:
-        error_msg = f"Error retrieving spreadsheet data: {str(e)}"
-        if ctx:
-            await ctx.error(error_msg)
-        
-        return {
-            "status": "error",
-            "message": error_msg
-        }
+                await ctx.info(f"Retrieved {len(data)} rows from worksheet '{worksheet.title}'")
+            
+            result = {
+                "status": "success",
+                "message": f"Spreadsheet data retrieved successfully",
+                "data": data,
+                "spreadsheet_url": spreadsheet.url,
+                "worksheet_name": worksheet.title
+            }
+            if cache_ttl:
+                read_cache_put(cache_key, result)
+            return result
+            
+        except Exception as e:
+            error_msg = f"Error retrieving spreadsheet data: {str(e)}"
+            if ctx:
+                await ctx.error(error_msg)
+            
+            return {
+                "status": "error",
+                "message": error_msg
+            }
 
 @mcp.tool()
 async def list_google_sheets(
@@ -402,7 +1224,7 @@ async def list_google_sheets(
     limit: Optional[int] = None,
     offset: Optional[int] = 0,
     ctx: Context = None
-) -> Dict[str, Union[str, List[Dict[str, str]], int]]:
+) -> Dict[str, Union[str, List[Dict[str, str]], bool, int, None]]:
     """List all Google Sheets accessible to the user.
     
     Args:
@@ -413,61 +1235,45 @@ async def list_google_sheets(
     
     Returns:
         Dictionary containing status, message, a list of spreadsheets with their IDs, titles, and timestamps,
-        total count, and pagination information
+        total count (None when more results exist than were fetched), and pagination information
     """
+    # Input validation
+    validation_errors = []
+    
+    # Validate pagination, both end up in the Drive request or in slicing its results
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit < 0):
+        validation_errors.append("limit must be a non-negative integer")
+    if offset is not None and (not isinstance(offset, int) or isinstance(offset, bool) or offset < 0):
+        validation_errors.append("offset must be a non-negative integer")
+    
+    if validation_errors:
+        return {
+            "status": "error",
+            "message": "; ".join(validation_errors)
+        }
+    offset = offset or 0
+    
     try:
         if ctx:
-            await ctx.info("Retrieving list of accessible Google Sheets")
-            if title:
-                await ctx.info(f"Filtering by title: {title}")
-            if folder_id:
-                await ctx.info(f"Filtering by folder ID: {folder_id}")
-            if limit is not None:
-                await ctx.info(f"Limiting results to: {limit}")
-            if offset > 0:
-                await ctx.info(f"Starting from offset: {offset}")
-        
-        client = init_gspread_client()
-        
-        # Get all spreadsheets the service account has access to
-        spreadsheets = []
-        
-        # Apply backoff to spreadsheet listing
-        @backoff_handler(max_retries=5, initial_delay=1.0)
-        def list_spreadsheets() -> List[Dict[str, Any]]:
-            # Get all spreadsheets the service account has access to using list_spreadsheet_files
-            # which provides more metadata and filtering options
-            sheet_files = client.list_spreadsheet_files(title=title, folder_id=folder_id)
-            
-            sheet_list = []
-            for sheet in sheet_files:
-                # Construct the URL from the ID
-                url = f"https://docs.google.com/spreadsheets/d/{sheet['id']}"
-                
-                sheet_list.append({
-                    "id": sheet['id'],
-                    "title": sheet['name'],
-                    "url": url,
-                    "created_time": sheet.get('createdTime', ''),
-                    "modified_time": sheet.get('modifiedTime', '')
-                })
-            return sheet_list
+            # Send the request details as a single log message
+            filters = [f"title={title!r}" if title else None,
+                       f"folder_id={folder_id!r}" if folder_id else None,
+                       f"limit={limit}" if limit is not None else None,
+                       f"offset={offset}" if offset > 0 else None]
+            filters = ", ".join(f for f in filters if f)
+            await ctx.info("Retrieving list of accessible Google Sheets" + (f" ({filters})" if filters else ""))
         
-        all_spreadsheets = list_spreadsheets()
-        total_count = len(all_spreadsheets)
+        client = await run_blocking(init_gspread_client)
         
-        # Apply pagination if specified
-        if offset > 0 or limit is not None:
-            # Handle offset
-            paginated_spreadsheets = all_spreadsheets[offset:] if offset < total_count else []
-            
-            # Handle limit if specified
-            if limit is not None:
-                paginated_spreadsheets = paginated_spreadsheets[:limit]
-        else:
-            paginated_spreadsheets = all_spreadsheets
+        # Only fetch as many pages as this window needs
+        max_results = offset + limit if limit is not None else None
+        all_spreadsheets, has_more = await run_blocking(list_spreadsheets, client, title, folder_id, max_results)
+        paginated_spreadsheets = all_spreadsheets[offset:]
         
-        if not all_spreadsheets:
+        # The total is only known once the listing has been exhausted
+        total_count = None if has_more else len(all_spreadsheets)
+        
+        if total_count == 0:
             return {
                 "status": "success",
                 "message": "No accessible Google Sheets found",
@@ -478,12 +1284,14 @@ async def list_google_sheets(
                 "has_more": False
             }
         
-        # Determine if there are more results beyond this page
-        has_more = (offset + len(paginated_spreadsheets) < total_count) if limit is not None else False
+        if total_count is None:
+            message = f"Found more than {len(all_spreadsheets)} accessible Google Sheets, returning {len(paginated_spreadsheets)}"
+        else:
+            message = f"Found {total_count} accessible Google Sheets, returning {len(paginated_spreadsheets)}"
         
         return {
             "status": "success",
-            "message": f"Found {total_count} accessible Google Sheets, returning {len(paginated_spreadsheets)}",
+            "message": message,
             "spreadsheets": paginated_spreadsheets,
             "total_count": total_count,
             "offset": offset,
@@ -0,0 +1,85 @@
+"""
+Helpers shared by scripts that talk to the Google Sheets MCP server.
+
+Provides deduplicated tool calls, parsing and printing of tool responses, and the
+client-side checks the example script runs before calling any tool.
+"""
+import asyncio
+import re
+import string
+import orjson
+
+# Characters allowed in each part of an email address
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + ".-")
+_EMAIL_TLD_CHARS = frozenset(string.ascii_letters)
+
+# Spreadsheet ID inside a Google Sheets URL
+_SPREADSHEET_ID_RE = re.compile(r"/spreadsheets/(?:u/\d+/)?d/([a-zA-Z0-9_-]+)")
+
+# Tool calls in flight keyed by (tool name, serialized arguments)
+_INFLIGHT = {}
+
+
+async def call_once(client, tool, arguments):
+    """Call an MCP tool, sharing the result with an identical call already in flight.
+    
+    Concurrent callers with the same tool and arguments await a single request,
+    so duplicate calls do not count twice against the Google API quota.
+    """
+    key = (tool, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(client.call_tool(tool, arguments))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # Shield the shared call so one caller being cancelled does not cancel it for the others
+    return await asyncio.shield(task)
+
+
+def parse_response(response):
+    """Parse the response from the MCP client.
+    
+    The response is a list of TextContent objects, and we need to extract the JSON string
+    from it and parse it into a Python dictionary.
+    """
+    # Newer fastmcp clients wrap the content list in a CallToolResult
+    content = getattr(response, "content", response)
+    
+    # Nearly every response is a single TextContent, so try that shape directly
+    try:
+        text = content[0].text
+    except (TypeError, IndexError, KeyError, AttributeError):
+        return None
+    try:
+        # Parse the JSON string into a Python dictionary
+        return orjson.loads(text)
+    except orjson.JSONDecodeError as e:
+        print(f"Error parsing JSON: {e}")
+        print(f"Text content: {text}")
+    return None
+
+
+def extract_spreadsheet_id(spreadsheet_url):
+    """Extract the spreadsheet ID from a Google Sheets URL, or None if there is none."""
+    match = _SPREADSHEET_ID_RE.search(spreadsheet_url)
+    return match.group(1) if match else None
+
+
+def format_json(data):
+    """Serialize a parsed response as indented JSON for printing."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+
+def is_valid_email(email):
+    """Check if the provided email address is valid.
+    
+    Accepts the same addresses as the pattern
+    ^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$ using plain string and set operations.
+    """
+    local, _, domain = email.partition('@')
+    host, _, tld = domain.rpartition('.')
+    return (bool(local) and bool(host) and len(tld) >= 2
+            and _EMAIL_LOCAL_CHARS.issuperset(local)
+            and _EMAIL_DOMAIN_CHARS.issuperset(host)
+            and _EMAIL_TLD_CHARS.issuperset(tld))
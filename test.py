@@ -11,6 +11,8 @@ using the Model Context Protocol (MCP). It demonstrates various operations such
 4. Listing all accessible Google Sheets
 5. Retrieving data from a Google Sheet
 
+Examples 1-3 are created together with a single batch_create_google_sheets call.
+
 Usage:
     python test.py --email user@example.com [--examples 1,2,3]
 
@@ -24,230 +26,131 @@ Example:
 """
 import asyncio
 import argparse
-import json
-import re
 import sys
+import time
 from fastmcp import Client
 from gsheets_mcp import mcp
+from mcp_test_utils import call_once, extract_spreadsheet_id, format_json, is_valid_email, parse_response
 
+# list_google_sheets responses keyed by (limit, offset), mapped to (fetched at, response)
+_LIST_CACHE = {}
+_LIST_CACHE_TTL = 60.0
 
-def parse_response(response):
-    """Parse the response from the MCP client.
-    
-    The response is a list of TextContent objects, and we need to extract the JSON string
-    from it and parse it into a Python dictionary.
-    """
-    if isinstance(response, list) and len(response) > 0:
-        # Extract the text from the first TextContent object
-        text = response[0].text
-        try:
-            # Parse the JSON string into a Python dictionary
-            return json.loads(text)
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON: {e}")
-            print(f"Text content: {text}")
-    return None
-
+# Formatting applied to every example spreadsheet
+_UPDATE_OPTS = {"set_basic_filter": True, "freeze_rows": 1, "set_bold_header": True}
 
-def is_valid_email(email):
-    """Check if the provided email address is valid."""
-    email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    return bool(email_pattern.match(email))
+# Spreadsheets created by Examples 1-3, built once at import time. Rows are
+# tuples since they are only serialized, never modified
+_EXAMPLE_SHEETS = {
+    # Example 1: Simple spreadsheet
+    1: {
+        "title": "Sample Spreadsheet",
+        "data_and_formulas": (
+            ("Name", "Department", "Salary"),
+            ("John Doe", "Engineering", 85000),
+            ("Jane Smith", "Marketing", 75000),
+            ("Bob Johnson", "Finance", 90000)
+        )
+    },
+    # Example 2: Spreadsheet with formulas
+    2: {
+        "title": "Budget Tracker",
+        "data_and_formulas": (
+            ("Month", "Income", "Expenses", "Savings"),
+            ("January", 5000, 3500, "=B2-C2"),
+            ("February", 5200, 3700, "=B3-C3"),
+            ("March", 5100, 3600, "=B4-C4"),
+            ("April", 5300, 3800, "=B5-C5"),
+            ("", "=SUM(B2:B5)", "=SUM(C2:C5)", "=SUM(D2:D5)")
+        )
+    },
+    # Example 3: Shared spreadsheet, sent column by column
+    3: {
+        "title": "Team Project Tracker",
+        "major_dimension": "COLUMNS",
+        "data_and_formulas": (
+            ("Task", "Research", "Design", "Development", "Testing"),
+            ("Assigned To", "Alice", "Bob", "Charlie", "Diana"),
+            ("Due Date", "2025-05-20", "2025-05-25", "2025-06-05", "2025-06-10"),
+            ("Status", "In Progress", "Not Started", "Not Started", "Not Started")
+        )
+    }
+}
 
 
-async def run_example_1(client, email):
-    """Run Example 1: Create a simple spreadsheet with data."""
-    print("\n--- Example 1: Simple Spreadsheet ---")
-    
-    # Create the spreadsheet
-    create_response = await client.call_tool(
-        "create_google_sheet",
-        {
-            "title": "Sample Spreadsheet",
-            "share_with": email
-        }
-    )
+async def run_examples_1_to_3(client, email, example_numbers):
+    """Run Examples 1-3: Create spreadsheets with data in a single batch call.
     
-    # Parse the response
-    create_data = parse_response(create_response)
-    if not create_data:
-        print("Error: Could not parse create response")
-        return None
-        
-    print(f"Create response: {json.dumps(create_data, indent=2)}")
+    Example 1 creates a simple spreadsheet with data, Example 2 a spreadsheet with
+    formulas and Example 3 a shared project tracker. All selected examples are sent
+    in one batch_create_google_sheets call.
     
-    # Extract the spreadsheet URL
-    if "spreadsheet_url" in create_data:
-        spreadsheet_url = create_data["spreadsheet_url"]
-        print(f"Spreadsheet URL: {spreadsheet_url}")
-    else:
-        print("Error: Could not get spreadsheet URL from create response")
-        return None
-    
-    # Update the spreadsheet with data
-    print("\nUpdating the spreadsheet with data...")
-    update_response = await client.call_tool(
-        "update_google_sheet",
-        {
-            "spreadsheet_url": spreadsheet_url,
-            "worksheet_name": None,  # Use default worksheet
-            "data_and_formulas": [
-                ["Name", "Department", "Salary"],
-                ["John Doe", "Engineering", 85000],
-                ["Jane Smith", "Marketing", 75000],
-                ["Bob Johnson", "Finance", 90000]
-            ],
-            "set_basic_filter": True,
-            "freeze_rows": 1,
-            "set_bold_header": True
-        }
-    )
-    # Parse the response
-    update_data = parse_response(update_response)
-    if not update_data:
-        print("Error: Could not parse update response")
-        return None
-        
-    print(f"Update response: {json.dumps(update_data, indent=2)}")
+    Args:
+        client: Connected MCP client
+        email: Email address to share the spreadsheets with
+        example_numbers: Which of the examples 1, 2 and 3 to run
     
-    return spreadsheet_url
-
-
-async def run_example_2(client, email):
-    """Run Example 2: Create a spreadsheet with formulas."""
-    print("\n--- Example 2: Spreadsheet with Formulas ---")
+    Returns:
+        Dictionary mapping each example number to its spreadsheet URL, or None if it was not created
+    """
+    print(f"\n--- Examples {', '.join(map(str, example_numbers))}: Batch Spreadsheet Creation ---")
     
-    # Create the spreadsheet
-    create_response = await client.call_tool(
-        "create_google_sheet",
+    # Create, share and fill all selected spreadsheets
+    batch_response = await call_once(
+        client,
+        "batch_create_google_sheets",
         {
-            "title": "Budget Tracker",
-            "share_with": email
+            "sheets": [
+                {**_EXAMPLE_SHEETS[number], "share_with": email, **_UPDATE_OPTS}
+                for number in example_numbers
+            ]
         }
     )
     
     # Parse the response
-    create_data = parse_response(create_response)
-    if not create_data:
-        print("Error: Could not parse create response")
-        return None
-        
-    print(f"Create response: {json.dumps(create_data, indent=2)}")
-    
-    # Extract the spreadsheet URL
-    if "spreadsheet_url" in create_data:
-        spreadsheet_url = create_data["spreadsheet_url"]
-        print(f"Spreadsheet URL: {spreadsheet_url}")
-    else:
-        print("Error: Could not get spreadsheet URL from create response")
-        return None
-    
-    # Update with data and formulas
-    print("\nUpdating with data and formulas...")
-    update_response = await client.call_tool(
-        "update_google_sheet",
-        {
-            "spreadsheet_url": spreadsheet_url,
-            "worksheet_name": None,  # Use default worksheet
-            "data_and_formulas": [
-                ["Month", "Income", "Expenses", "Savings"],
-                ["January", 5000, 3500, "=B2-C2"],
-                ["February", 5200, 3700, "=B3-C3"],
-                ["March", 5100, 3600, "=B4-C4"],
-                ["April", 5300, 3800, "=B5-C5"],
-                ["", "=SUM(B2:B5)", "=SUM(C2:C5)", "=SUM(D2:D5)"]
-            ],
-            "set_basic_filter": True,
-            "freeze_rows": 1,
-            "set_bold_header": True
-        }
-    )
-    # Parse the response
-    update_data = parse_response(update_response)
-    if not update_data:
-        print("Error: Could not parse update response")
-        return None
-        
-    print(f"Update response: {json.dumps(update_data, indent=2)}")
-    
-    return spreadsheet_url
+    batch_data = parse_response(batch_response)
+    if not batch_data:
+        print("Error: Could not parse batch create response")
+        return {}
+    
+    print(f"Batch create response: {format_json(batch_data)}")
+    
+    # Extract the spreadsheet URLs, results are in request order
+    spreadsheet_urls = {}
+    for number, result in zip(example_numbers, batch_data.get("spreadsheets", [])):
+        spreadsheet_urls[number] = result.get("spreadsheet_url")
+        if spreadsheet_urls[number]:
+            print(f"Example {number} spreadsheet URL: {spreadsheet_urls[number]}")
+        else:
+            print(f"Error: Could not get spreadsheet URL for Example {number}")
+    
+    return spreadsheet_urls
 
 
-async def run_example_3(client, email):
-    """Run Example 3: Create and share a spreadsheet."""
-    print("\n--- Example 3: Shared Spreadsheet ---")
-    
-    # Create and share the spreadsheet
-    create_response = await client.call_tool(
-        "create_google_sheet",
-        {
-            "title": "Team Project Tracker",
-            "share_with": email
-        }
-    )
-    
-    # Parse the response
-    create_data = parse_response(create_response)
-    if not create_data:
-        print("Error: Could not parse create response")
-        return None
-        
-    print(f"Create response: {json.dumps(create_data, indent=2)}")
-    
-    # Extract the spreadsheet URL
-    if "spreadsheet_url" in create_data:
-        spreadsheet_url = create_data["spreadsheet_url"]
-        print(f"Spreadsheet URL: {spreadsheet_url}")
-    else:
-        print("Error: Could not get spreadsheet URL from create response")
-        return None
-    
-    # Update with data
-    print("\nUpdating with data...")
-    
-    # Define the data to be added to the spreadsheet
-    data = [
-        ["Task", "Assigned To", "Due Date", "Status"],
-        ["Research", "Alice", "2025-05-20", "In Progress"],
-        ["Design", "Bob", "2025-05-25", "Not Started"],
-        ["Development", "Charlie", "2025-06-05", "Not Started"],
-        ["Testing", "Diana", "2025-06-10", "Not Started"]
-    ]
-    
-    update_response = await client.call_tool(
-        "update_google_sheet",
+async def cached_list_google_sheets(client, limit, offset, ttl=_LIST_CACHE_TTL):
+    """Call list_google_sheets, reusing a response fetched less than ttl seconds ago."""
+    key = (limit, offset)
+    cached = _LIST_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    
+    response = await call_once(
+        client,
+        "list_google_sheets",
         {
-            "spreadsheet_url": spreadsheet_url,
-            "worksheet_name": None,
-            "data_and_formulas": data,
-            "set_basic_filter": True,
-            "freeze_rows": 1,
-            "set_bold_header": True
+            "limit": limit,
+            "offset": offset
         }
     )
-    
-    # Parse the response
-    update_data = parse_response(update_response)
-    if not update_data:
-        print("Error: Could not parse update response")
-        return None
-        
-    print(f"Update response: {json.dumps(update_data, indent=2)}")
-    
-    return spreadsheet_url
+    _LIST_CACHE[key] = (time.monotonic(), response)
+    return response
 
 
 async def run_example_4(client):
     """Run Example 4: List all Google Sheets."""
     print("\n--- Example 4: List Google Sheets ---")
     
-    list_response = await client.call_tool(
-        "list_google_sheets",
-        {
-            "limit": 10,
-            "offset": 0
-        }
-    )
+    list_response = await cached_list_google_sheets(client, limit=10, offset=0)
     
     # Parse the response
     list_data = parse_response(list_response)
@@ -255,7 +158,7 @@ async def run_example_4(client):
         print("Error: Could not parse list response")
         return None
         
-    print(f"List response: {json.dumps(list_data, indent=2)}")
+    print(f"List response: {format_json(list_data)}")
     
     return True
 
@@ -268,11 +171,12 @@ async def run_example_5(client, spreadsheet_url):
         print("Error: No spreadsheet URL available for Example 5")
         return None
     
-    get_response = await client.call_tool(
+    # Pass the ID when the URL has one, so the server has nothing to parse
+    spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
+    get_response = await call_once(
+        client,
         "get_google_sheet",
-        {
-            "spreadsheet_url": spreadsheet_url
-        }
+        {"spreadsheet_id": spreadsheet_id} if spreadsheet_id else {"spreadsheet_url": spreadsheet_url}
     )
     
     # Parse the response
@@ -281,13 +185,15 @@ async def run_example_5(client, spreadsheet_url):
         print("Error: Could not parse get response")
         return None
         
-    print(f"Get response: {json.dumps(get_data, indent=2)}")
+    # Rows are printed below, so leave them out of the response dump
+    rows = get_data.pop("data", None)
+    print(f"Get response: {format_json(get_data)}")
     
     # Display the retrieved data
-    if "data" in get_data:
+    if rows is not None:
         print("\nSheet Data:")
-        for row in get_data["data"]:
-            print(row)
+        # One write for all rows instead of a print call per row
+        sys.stdout.write("".join(f"{row}\n" for row in rows))
     else:
         print("Error: Could not get data from get_google_sheet response")
     
@@ -308,28 +214,24 @@ async def main(email, examples_to_run=None):
     
     try:
         async with Client(mcp) as client:
+            # Examples 1-3 are created in one batch call, concurrently with Example 4
+            batch_numbers = [number for number in (1, 2, 3)
+                             if examples_to_run is None or number in examples_to_run]
+            example_runs = {}
+            if batch_numbers:
+                example_runs["1-3"] = run_examples_1_to_3(client, email, batch_numbers)
+            if examples_to_run is None or 4 in examples_to_run:
+                example_runs["4"] = run_example_4(client)
+            results = await asyncio.gather(*example_runs.values(), return_exceptions=True)
+            
             # Track the last created spreadsheet URL for Example 5
             last_spreadsheet_url = None
-            
-            # Run Example 1: Create a simple spreadsheet
-            if examples_to_run is None or 1 in examples_to_run:
-                last_spreadsheet_url = await run_example_1(client, email)
-            
-            # Run Example 2: Create a spreadsheet with formulas
-            if examples_to_run is None or 2 in examples_to_run:
-                sheet_url = await run_example_2(client, email)
-                if sheet_url:
-                    last_spreadsheet_url = sheet_url
-            
-            # Run Example 3: Create and share a spreadsheet
-            if examples_to_run is None or 3 in examples_to_run:
-                sheet_url = await run_example_3(client, email)
-                if sheet_url:
-                    last_spreadsheet_url = sheet_url
-            
-            # Run Example 4: List all Google Sheets
-            if examples_to_run is None or 4 in examples_to_run:
-                await run_example_4(client)
+            for label, result in zip(example_runs, results):
+                if isinstance(result, Exception):
+                    print(f"Error during example {label}: {str(result)}")
+                elif label == "1-3":
+                    last_spreadsheet_url = next(
+                        (result[number] for number in reversed(batch_numbers) if result.get(number)), None)
             
             # Run Example 5: Get data from a Google Sheet
             if examples_to_run is None or 5 in examples_to_run:
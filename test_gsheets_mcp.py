@@ -0,0 +1,245 @@
+"""
+Checks for the Google Sheets MCP tools that run without Google credentials.
+
+The gspread client is replaced with a fake one, and every tool is called
+through an in-memory fastmcp Client so the results are validated against the
+tools' output schemas, just like for a real MCP client.
+
+Usage:
+    python -m unittest test_gsheets_mcp
+"""
+import unittest
+from unittest import mock
+from fastmcp import Client
+import gsheets_mcp
+from gsheets_mcp import mcp
+
+
+def fake_drive_client(file_count):
+    """Build a fake gspread client whose Drive listing returns file_count spreadsheets."""
+    files = [{"id": f"sheet{index}", "name": f"Sheet {index}"} for index in range(file_count)]
+    
+    def request(method, url, params=None):
+        # Page tokens are the index of the first file on the page
+        start = int(params.get("pageToken") or 0)
+        end = start + params["pageSize"]
+        page = {"files": files[start:end]}
+        if end < len(files):
+            page["nextPageToken"] = str(end)
+        response = mock.MagicMock()
+        response.json.return_value = page
+        return response
+    
+    client = mock.MagicMock()
+    client.http_client.request.side_effect = request
+    return client
+
+
+class ListGoogleSheetsTest(unittest.IsolatedAsyncioTestCase):
+    """list_google_sheets paginated through the MCP client."""
+    
+    async def list_sheets(self, file_count, arguments):
+        client = fake_drive_client(file_count)
+        with mock.patch.object(gsheets_mcp, "init_gspread_client", return_value=client):
+            async with Client(mcp) as mcp_client:
+                result = await mcp_client.call_tool("list_google_sheets", arguments)
+        return result.data, client.http_client.request.call_count
+    
+    async def test_limit_stops_listing_early(self):
+        data, page_requests = await self.list_sheets(25, {"limit": 10, "offset": 0})
+        self.assertEqual(data["status"], "success")
+        self.assertEqual([sheet["id"] for sheet in data["spreadsheets"]],
+                         [f"sheet{index}" for index in range(10)])
+        self.assertIs(data["has_more"], True)
+        self.assertIsNone(data["total_count"])
+        self.assertEqual(page_requests, 1)
+    
+    async def test_offset_past_first_page(self):
+        data, page_requests = await self.list_sheets(25, {"limit": 10, "offset": 20})
+        self.assertEqual([sheet["id"] for sheet in data["spreadsheets"]],
+                         [f"sheet{index}" for index in range(20, 25)])
+        self.assertIs(data["has_more"], False)
+        self.assertEqual(data["total_count"], 25)
+        self.assertEqual(page_requests, 1)
+    
+    async def test_without_limit_lists_everything(self):
+        data, _ = await self.list_sheets(25, {})
+        self.assertEqual(len(data["spreadsheets"]), 25)
+        self.assertIs(data["has_more"], False)
+        self.assertEqual(data["total_count"], 25)
+        self.assertIsNone(data["limit"])
+    
+    async def test_negative_pagination_is_rejected(self):
+        data, page_requests = await self.list_sheets(25, {"limit": -1, "offset": -5})
+        self.assertEqual(data["status"], "error")
+        self.assertIn("limit must be a non-negative integer", data["message"])
+        self.assertIn("offset must be a non-negative integer", data["message"])
+        self.assertEqual(page_requests, 0)
+
+
+class GetGoogleSheetCacheTest(unittest.IsolatedAsyncioTestCase):
+    """get_google_sheet only caches results for calls that ask for caching."""
+    
+    async def get_sheet(self, arguments):
+        spreadsheet = mock.MagicMock(url="https://docs.google.com/spreadsheets/d/cached")
+        worksheet = mock.MagicMock(title="Sheet1")
+        with mock.patch.object(gsheets_mcp, "init_gspread_client"), \
+                mock.patch.object(gsheets_mcp, "open_spreadsheet", return_value=spreadsheet), \
+                mock.patch.object(gsheets_mcp, "find_worksheet", return_value=worksheet), \
+                mock.patch.object(gsheets_mcp, "get_worksheet_data", return_value=[["a", 1]]) as get_data:
+            async with Client(mcp) as mcp_client:
+                result = await mcp_client.call_tool("get_google_sheet", {"spreadsheet_id": "cached", **arguments})
+        return result.data, get_data.call_count
+    
+    def setUp(self):
+        gsheets_mcp.read_cache_invalidate("cached")
+    
+    async def test_uncached_call_is_not_stored(self):
+        await self.get_sheet({})
+        data, fetches = await self.get_sheet({"cache_ttl": 60})
+        self.assertEqual(data["message"], "Spreadsheet data retrieved successfully")
+        self.assertEqual(fetches, 1)
+    
+    async def test_cached_call_is_reused(self):
+        await self.get_sheet({"cache_ttl": 60})
+        data, fetches = await self.get_sheet({"cache_ttl": 60})
+        self.assertEqual(data["message"], "Spreadsheet data retrieved from cache")
+        self.assertEqual(data["data"], [["a", 1]])
+        self.assertEqual(fetches, 0)
+
+
+class BatchCreateGoogleSheetsTest(unittest.IsolatedAsyncioTestCase):
+    """batch_create_google_sheets validation and per-sheet error reporting."""
+    
+    async def test_unhashable_and_mistyped_options(self):
+        sheets = [{
+            "title": "Typed wrong",
+            "share_with": "user@example.com",
+            "major_dimension": ["ROWS"],
+            "freeze_rows": "1",
+            "set_basic_filter": {},
+            "set_bold_header": 1
+        }]
+        with mock.patch.object(gsheets_mcp, "init_gspread_client") as init_client:
+            async with Client(mcp) as mcp_client:
+                result = await mcp_client.call_tool("batch_create_google_sheets", {"sheets": sheets})
+        self.assertEqual(result.data["status"], "error")
+        for option in ("major_dimension", "freeze_rows", "set_basic_filter", "set_bold_header"):
+            self.assertIn(f"sheets[0]: {option}", result.data["message"])
+        init_client.assert_not_called()
+
+    
+    async def test_failed_batches_keep_created_sheets(self):
+        batches = []
+        
+        class FakeBatch:
+            def __init__(self, callback):
+                self.callback = callback
+                self.request_ids = []
+                batches.append(self)
+            
+            def add(self, request, request_id):
+                self.request_ids.append(request_id)
+            
+            def execute(self):
+                # The first create batch goes through, every later batch fails outright
+                if len(batches) > 1:
+                    raise RuntimeError("backend unavailable")
+                for request_id in self.request_ids:
+                    self.callback(request_id, {"id": f"created{request_id}"}, None)
+        
+        drive = mock.MagicMock()
+        drive.new_batch_http_request.side_effect = lambda callback: FakeBatch(callback)
+        sheets = [{"title": f"Report {index}", "share_with": "user@example.com"} for index in range(2)]
+        with mock.patch.object(gsheets_mcp, "init_gspread_client"), \
+                mock.patch.object(gsheets_mcp, "drive_service", return_value=drive), \
+                mock.patch.object(gsheets_mcp, "_DRIVE_BATCH_SIZE", 1):
+            async with Client(mcp) as mcp_client:
+                result = await mcp_client.call_tool("batch_create_google_sheets", {"sheets": sheets})
+        
+        self.assertEqual(result.data["status"], "partial_success")
+        created, failed = result.data["spreadsheets"]
+        self.assertEqual(created["status"], "partial_success")
+        self.assertIn("sharing failed for user@example.com", created["message"])
+        self.assertEqual(created["spreadsheet_url"], "https://docs.google.com/spreadsheets/d/created0")
+        self.assertEqual(failed["status"], "error")
+        self.assertIn("backend unavailable", failed["message"])
+
+
+
+class WorksheetCacheTest(unittest.TestCase):
+    """Cached worksheet lists do not hide tabs added or changed in the meantime."""
+    
+    def fake_spreadsheet(self, *titles):
+        spreadsheet = mock.MagicMock(id="tabs")
+        spreadsheet.worksheets.return_value = [mock.MagicMock(title=title) for title in titles]
+        return spreadsheet
+    
+    def setUp(self):
+        self.spreadsheet = self.fake_spreadsheet("Sheet1")
+        gsheets_mcp.forget_worksheets(self.spreadsheet)
+    
+    def test_missing_title_is_refetched(self):
+        gsheets_mcp.find_worksheet(self.spreadsheet, "Sheet1")
+        self.spreadsheet.worksheets.return_value.append(mock.MagicMock(title="Added"))
+        self.assertEqual(gsheets_mcp.find_worksheet(self.spreadsheet, "Added").title, "Added")
+        self.assertIsNone(gsheets_mcp.find_worksheet(self.spreadsheet, "Missing"))
+        self.assertEqual(self.spreadsheet.worksheets.call_count, 3)
+    
+    def test_cached_title_is_reused_until_forgotten(self):
+        gsheets_mcp.find_worksheet(self.spreadsheet, "Sheet1")
+        gsheets_mcp.find_worksheet(self.spreadsheet, "Sheet1")
+        self.assertEqual(self.spreadsheet.worksheets.call_count, 1)
+        gsheets_mcp.forget_worksheets(self.spreadsheet)
+        gsheets_mcp.find_worksheet(self.spreadsheet, "Sheet1")
+        self.assertEqual(self.spreadsheet.worksheets.call_count, 2)
+
+
+class BackoffHandlerTest(unittest.TestCase):
+    """backoff_handler attempts, retries and rate limiter waits."""
+    
+    def test_sleeps_do_not_hold_a_slot(self):
+        free_slots = []
+        
+        def sleep(seconds):
+            # Count how many slots another thread could take while this one waits
+            taken = 0
+            while gsheets_mcp._API_CONCURRENCY.acquire(blocking=False):
+                taken += 1
+            for _ in range(taken):
+                gsheets_mcp._API_CONCURRENCY.release()
+            free_slots.append(taken)
+        
+        error = gsheets_mcp.gspread.exceptions.APIError(mock.MagicMock(status_code=503, headers={}))
+        call = mock.MagicMock(side_effect=[error, "done"], __name__="call")
+        limiter = gsheets_mcp.TokenBucket(rate=1, capacity=1)
+        limiter.tokens = 0
+        with mock.patch.object(gsheets_mcp.time, "sleep", side_effect=sleep):
+            result = gsheets_mcp.backoff_handler(max_retries=2, rate_limiter=limiter)(call)()
+        self.assertEqual(result, "done")
+        self.assertGreaterEqual(len(free_slots), 2)
+        self.assertEqual(set(free_slots), {5})
+    
+    def test_needs_at_least_one_attempt(self):
+        with self.assertRaises(ValueError):
+            gsheets_mcp.backoff_handler(max_retries=0)
+
+
+class SpreadsheetUrlTest(unittest.TestCase):
+    """Spreadsheet URLs are accepted in the forms Google hands out."""
+    
+    def test_workspace_and_account_urls(self):
+        for url in ("https://docs.google.com/spreadsheets/d/abc_123-XYZ/edit#gid=0",
+                    "https://docs.google.com/a/example.com/spreadsheets/d/abc_123-XYZ/edit",
+                    "https://docs.google.com/spreadsheets/u/0/d/abc_123-XYZ/edit"):
+            self.assertIsNone(gsheets_mcp.validate_spreadsheet_ref(url, None), url)
+            self.assertEqual(gsheets_mcp.extract_spreadsheet_id(url), "abc_123-XYZ")
+    
+    def test_rejects_other_hosts_and_documents(self):
+        for url in ("https://example.com/spreadsheets/d/abc_123-XYZ",
+                    "https://docs.google.com/document/d/abc_123-XYZ/edit"):
+            self.assertIsNotNone(gsheets_mcp.validate_spreadsheet_ref(url, None), url)
+
+
+if __name__ == "__main__":
+    unittest.main()